@@ -1,24 +1,91 @@
 import argparse
+import atexit
+import ctypes
+import errno
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
+import signal
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+try:
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional, without it the source is only polled
+    Observer = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used without it
+    orjson = None
+
 # File name for storing folder states
 STATE_FILE_NAME = "folder_states.json"
 
+# Source top folders are named project-nextclouduser-In
+PROJECT_USER_FOLDER_PATTERN = re.compile(r'^([^-]*)-([^-]*)-In$')
+
+# Maximum number of bytes handed to a single os.copy_file_range call
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
+# Number of files copied concurrently by copy_folder
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of packages synced concurrently by monitor_directory
+PACKAGE_WORKERS = 2
+
+# Minimum number of seconds between two saves of the folder states, unless a package was copied
+STATE_SAVE_INTERVAL = 30
+
+# Maximum number of seconds between two full source scans while watchdog reports no events,
+# since events can be missing on network mounts or lost when the event queue overflows
+FULL_SCAN_INTERVAL = 300
+
+# Size of a log file before it is rotated, and the number of rotated log files kept
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Destination directories known to exist, so they are created only once per process
+_ensured_dirs = set()
+
+# statx(2) arguments for reading cached file sizes on Linux, see _file_size
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_SIZE = 0x200
+STATX_BUFFER_SIZE = 256
+STATX_MASK_OFFSET = 0
+STATX_SIZE_OFFSET = 40
+
+# Filesystem types whose clients cache file attributes, so _file_size is worth using on them
+NETWORK_FILESYSTEM_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "ceph", "9p", "afs", "lustre",
+    "glusterfs", "fuse.glusterfs", "fuse.sshfs", "fuse.rclone", "fuse.davfs2",
+})
+
+# Whether a device (st_dev) holds a network filesystem, see _is_network_filesystem
+_network_devices = {}
+
+# Cached destination base listings: {base: (base mtime_ns, {folder name: folder path})}
+_destination_cache = {}
+
 def load_folder_states(source_path):
     """
     Loads the folder states from a specified source directory.
 
-    This function attempts to read a JSON file from the given source directory.
-    If the file is found and successfully read, its contents are parsed into a
-    dictionary representing the folder states. If the file is not found or an
-    error occurs during reading or parsing, appropriate log warnings are generated.
+    This function attempts to read a JSON file from the given source directory,
+    using orjson when it is installed. If the file is found and successfully read,
+    its contents are parsed into a dictionary representing the folder states. If
+    the file is not found or an error occurs during reading or parsing,
+    appropriate log warnings are generated.
     Returns an empty dictionary if the file is absent or fails to load.
 
     Parameters:
@@ -36,18 +103,24 @@ def load_folder_states(source_path):
     """
     folder_states = {}
     state_file_path = os.path.join(source_path, STATE_FILE_NAME)
-    if os.path.exists(state_file_path):
-        try:
-            # Open the JSON file
-            with open(state_file_path, 'r') as cache_file:
+    try:
+        # Open the JSON file and parse it into a dictionary
+        with open(state_file_path, 'rb') as cache_file:
+            if orjson is not None:
                 data = cache_file.read()
-            # Parse JSON data into a dictionary
-            folder_states = json.loads(data)
-        except Exception as e:
-            # Log warning if file fails to load and skip this directory
-            logging.warning(f"Failed to load folder states for {source_path}: {e}")
-    else:
+                try:
+                    folder_states = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    # folder names that aren't valid UTF-8 are saved as escaped surrogates,
+                    # which only the json module reads back
+                    folder_states = json.loads(data)
+            else:
+                folder_states = json.load(cache_file)
+    except FileNotFoundError:
         logging.warning(f"The folder states file not found: {source_path}")
+    except Exception as e:
+        # Log warning if file fails to load and skip this directory
+        logging.warning(f"Failed to load folder states for {source_path}: {e}")
 
     return folder_states
 
@@ -57,8 +130,10 @@ def save_folder_states(source_path, folder_states):
 
     This function serializes the provided folder states and writes them to a
     JSON file named with the value of `STATE_FILE_NAME` in the specified
-    `source_path`. If the operation fails, it logs an error message with the
-    details of the failure.
+    `source_path`, using orjson when it is installed. The JSON is written
+    compactly to a temporary file first and then moved over the state file, so
+    an interrupted save never leaves a truncated state file behind. If the
+    operation fails, it logs an error message with the details of the failure.
 
     Parameters:
     source_path: str
@@ -66,24 +141,51 @@ def save_folder_states(source_path, folder_states):
     folder_states: dict
         A dictionary representing the states of folders to be saved.
 
+    Returns:
+    bool
+        True if the folder states were saved, otherwise False.
+
     Raises:
     Exception
         If an error occurs during the file writing process, it will be logged
         but not re-raised.
     """
     state_file_path = os.path.join(source_path, STATE_FILE_NAME)
+    temp_file_path = state_file_path + ".tmp"
     try:
-        with open(state_file_path, "w") as state_file_path:
-            json.dump(folder_states, state_file_path, sort_keys=True, indent=4)
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(folder_states, option=orjson.OPT_SORT_KEYS)
+            except orjson.JSONEncodeError:
+                # orjson rejects the surrogate-escaped names of folders that aren't valid UTF-8
+                logging.debug("orjson could not serialize the folder states, using json.")
+        if data is None:
+            data = json.dumps(folder_states, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        with open(temp_file_path, "wb") as state_file:
+            state_file.write(data)
+        os.replace(temp_file_path, state_file_path)
     except Exception as e:
-        # Log error if state saving fails
+        # Log error if state saving fails, and don't leave a partial temporary file behind
         logging.error(f"Failed to save folder states for {state_file_path}: {e}", exc_info=True)
+        try:
+            os.remove(temp_file_path)
+        except OSError:
+            pass
+        return False
+    return True
 
 def configure_logging(log_level=logging.INFO, log_directory="."):
     """
     Configures the logging system for the application. This function sets up logging
     to output both to a file and the console. The log files are stored in a specified
-    directory, and their names contain a timestamp for distinction.
+    directory, and their names contain a timestamp for distinction. A log file is
+    rotated once it reaches LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT older files,
+    so DEBUG logging of a long running monitor doesn't fill the disk.
+
+    Log records are put on a queue and written to the file and console by a
+    background QueueListener thread, so logging never blocks the monitoring loop
+    on I/O. The listener is stopped, flushing pending records, at interpreter exit.
 
     Args:
         log_level: The logging level to be set. Defaults to logging.INFO.
@@ -95,13 +197,24 @@ def configure_logging(log_level=logging.INFO, log_directory="."):
     os.makedirs(log_directory, exist_ok=True)
     log_filename = os.path.join(log_directory, f"folder_monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
 
+    formatter = logging.Formatter("%(asctime)s - [%(levelname)s] - %(message)s")
+    handlers = [
+        logging.handlers.RotatingFileHandler(log_filename, maxBytes=LOG_MAX_BYTES,
+                                             backupCount=LOG_BACKUP_COUNT, delay=True),  # Log to file
+        logging.StreamHandler()  # Log to console
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=log_level,  # Set the base logging level
-        format="%(asctime)s - [%(levelname)s] - %(message)s",
-        handlers=[
-            logging.FileHandler(log_filename),  # Log to file
-            logging.StreamHandler()  # Log to console
-        ],
+        format="%(message)s",  # Records are formatted by the listener handlers
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
     logging.info("Logging initialized. Writing to log file and console.")
 
@@ -133,16 +246,127 @@ def _run_post_sync_command(package, command):
 
     logging.info(f"Running post-sync command for {package['project_name']} {package['user_name']} {package['package_name']}")
     try:
-        logging.debug(
-            f"Running post-sync command:\n{cmd}")
+        logging.debug("Running post-sync command:\n%s", cmd)
         subprocess.run(cmd, shell=True, check=False)
     except subprocess.CalledProcessError as exc:
         logging.error(
             f"Running post-sync command failed for {package['project_name']} {package['user_name']} {package['package_name']}\n{exc}")
 
 
+class SourceChangeCollector:
+    """
+    Collects the source packages touched by filesystem events.
+
+    An instance is scheduled as a watchdog event handler on the source directory. Every
+    event under a project-nextclouduser-In folder marks its package as changed, so
+    packages without events can skip the checksum scan until the final stability check.
+    Events on a project-nextclouduser-In folder itself, e.g. when it is moved in as a
+    whole, record the folder path, so the set of changes is not empty.
+    """
+
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self._lock = threading.Lock()
+        self._changed_packages = set()
+
+    def dispatch(self, event):
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self._add(os.fsdecode(path))
+
+    def _add(self, path):
+        parts = os.path.relpath(path, self.source_path).split(os.sep)
+        if PROJECT_USER_FOLDER_PATTERN.match(parts[0]):
+            package_path = os.path.join(self.source_path, *parts[:2]).replace("\\", "/")
+            with self._lock:
+                self._changed_packages.add(package_path)
+
+    def drain(self):
+        """
+        Returns the package paths changed since the last call and starts collecting anew.
+        """
+        with self._lock:
+            changed_packages, self._changed_packages = self._changed_packages, set()
+        return changed_packages
+
+def _start_source_watch(source_path):
+    """
+    Starts watching the source directory for changes when watchdog is available.
+
+    Returns:
+        SourceChangeCollector or None: The collector receiving the events, or None when
+            watchdog is not installed or the watch could not be started.
+    """
+    if Observer is None:
+        logging.info("watchdog is not installed, checking all packages on every scan.")
+        return None
+
+    collector = SourceChangeCollector(source_path)
+    try:
+        observer = Observer()
+        observer.schedule(collector, source_path, recursive=True)
+        observer.start()
+    except Exception as e:
+        logging.warning(f"Failed to watch {source_path} for changes, checking all packages on every scan: {e}")
+        return None
+    logging.info(f"Watching {source_path} for changes.")
+    return collector
+
+def sync_package(pkg_path, pkg, launch_cmd=None, copy_workers=COPY_WORKERS):
+    """
+    Copies a stable source package to its destination and records the outcome in its state.
+
+    Files already present at the destination with the same size are skipped. If the source
+    changed since it was found stable, the package goes back to stability checking; if the
+    copy can't be verified, its copy retry count is increased. After a verified copy the
+    post-sync command is run.
+
+    Args:
+        pkg_path (str): The path of the source package.
+        pkg (dict): The package state, updated in place.
+        launch_cmd (str, optional): Post-sync command template. Default is None.
+        copy_workers (int, optional): Number of files copied concurrently. Default is COPY_WORKERS.
+
+    Returns:
+        dict: The updated package state.
+    """
+    destination = pkg.get("destination_package_path", "")
+    _ensure_dir(destination)
+    logging.info(f"Copying files from {pkg_path} to {destination}...")
+    # files already at the destination, e.g. from an interrupted copy, are skipped
+    destination_state = get_folder_files(destination)
+    source_state, synced_state = copy_folder(pkg_path, destination, destination_state, copy_workers)
+    source_checksum = get_state_checksum(source_state)
+    if source_checksum != pkg.get("checksum"):
+        # the package changed after it was found stable, check its stability again
+        pkg["stable_checks"] = 0
+        pkg["checksum"] = source_checksum
+        pkg["watermark"] = None
+        logging.info(f"Package {pkg_path} changed since its last check. Checking its stability again...")
+    elif synced_state:
+        destination_checksum = get_state_checksum(synced_state)
+        logging.debug("Comparing checksums %s %s", pkg.get('checksum'), destination_checksum)
+        if destination_checksum == pkg.get("checksum"):
+            pkg["is_synced_to_destination"] = True
+            pkg["copied_date_time"] = datetime.now().strftime("%Y%m%d_%H%M%S")
+            logging.info(f"Files copied from {pkg_path} to {destination}...")
+
+            # running post-sync command
+            if launch_cmd is not None:
+                _run_post_sync_command(pkg, launch_cmd)
+        else:
+            pkg["is_synced_to_destination"] = False
+            pkg["copy_retry_count"] += 1
+            logging.info(f"Failed copying {pkg['copy_retry_count']} times from {pkg_path} to {destination}")
+    else:
+        pkg["is_synced_to_destination"] = False
+        pkg["copy_retry_count"] += 1
+        logging.info(f"Failed copying {pkg['copy_retry_count']} times from {pkg_path} to {destination}")
+    return pkg
+
 def monitor_directory(source_path, destination_bases, check_interval=10,
-                      launch_cmd=None, stable_checks=3, retry_copy=2, ingest_prefix="in/vendors"):
+                      launch_cmd=None, stable_checks=3, retry_copy=2, ingest_prefix="in/vendors",
+                      copy_workers=COPY_WORKERS, package_workers=PACKAGE_WORKERS):
     """
     Monitors a specified directory for valid source packages and synchronizes these packages to appropriate
     destinations by copying them once specific conditions such as stability checks and retry limits are satisfied.
@@ -162,81 +386,161 @@ def monitor_directory(source_path, destination_bases, check_interval=10,
         stable_checks (int, optional): Number of consecutive checks required to confirm a package is stable. Default is 3.
         retry_copy (int, optional): Maximum number of retry attempts allowed for copying a package. Default is 2.
         ingest_prefix (str, optional): Prefix string determining the structure and sources to ingest packages. Default is "in/vendors".
+        copy_workers (int, optional): Number of files copied concurrently. Default is COPY_WORKERS.
+        package_workers (int, optional): Number of packages copied concurrently. Default is PACKAGE_WORKERS.
     """
 
     # read cached source folders
     folder_states = load_folder_states(source_path)
+    saved_states = folder_states
+    last_save_time = time.monotonic()
     destination_projects = find_all_destination_projects(destination_bases)
 
     logging.info(f"Starting to monitor directory: {source_path}")
+    change_collector = _start_source_watch(source_path)
+    last_full_scan_time = time.monotonic()
 
     # Get a dictionary where keys are the absolute paths of valid source packages and
     # values are dictionaries containing metadata such as the `project_name`, `user_name`,
     # destination information, synchronization states, and the folder checksum.
     all_source_packages = find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_copy, destination_projects, folder_states)
-    logging.debug(f"Found {len(all_source_packages.keys())} valid source packages to check.")
+    logging.debug("Found %d valid source packages to check.", len(all_source_packages))
 
-    while True:
-        try:
-            logging.debug(f"Scanning source directory: {source_path}")
-            # Process each folder in the source directory if ready for copying
-            for pkg_path, pkg in all_source_packages.items():
-                if not pkg.get("is_synced_to_destination", False):
-                    if pkg.get("stable_checks", 0) > stable_checks:
-                        if retry_copy > pkg.get("copy_retry_count", 0):
-                            # Those packages are not changing size and is not synced yet
-                            # let's copy
-
-                            destination = pkg.get("destination_package_path", "")
-                            os.makedirs(destination, exist_ok=True)
-                            logging.info(f"Copying files from {pkg_path} to {destination}...")
-                            copied = copy_folder(pkg_path, destination, {})
-                            if copied:
-                                destination_checksum = get_folder_state(destination)
-                                logging.debug(
-                                    f"Comparing checksums {pkg.get('checksum')} {destination_checksum}")
-                                if destination_checksum == pkg.get("checksum"):
-                                    pkg["is_synced_to_destination"] = True
-                                    pkg["copied_date_time"] = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                    logging.info(f"Files copied from {pkg_path} to {destination}...")
-                                    
-                                    # running post-sync command
-                                    if launch_cmd is not None:
-                                        _run_post_sync_command(pkg, launch_cmd)
-                                else:
-                                    pkg["is_synced_to_destination"] = False
-                                    pkg["copy_retry_count"] += 1
-                                    logging.info(f"Failed copying {pkg['copy_retry_count']} times from {pkg_path} to {destination}")
+    # packages are copied in the background, so scanning goes on while large packages copy.
+    # Each copy works on its own copy of the package state, which replaces the scanned one when done.
+    copy_pool = ThreadPoolExecutor(max_workers=package_workers)
+    copy_futures = {}
+
+    def _reap_copies():
+        finished = False
+        for pkg_path, future in list(copy_futures.items()):
+            if not future.done():
+                continue
+            del copy_futures[pkg_path]
+            if future.cancelled():
+                continue
+            finished = True
+            try:
+                synced_pkg = future.result()
+            except Exception as e:
+                logging.error(f"Error during syncing {pkg_path}: {e}", exc_info=True)
+                continue
+            if pkg_path in all_source_packages:
+                all_source_packages[pkg_path] = synced_pkg
+        return finished
+
+    try:
+        while True:
+            copy_attempted = _reap_copies()
+            try:
+                logging.debug("Scanning source directory: %s", source_path)
+                # Process each folder in the source directory if ready for copying
+                ready_packages = []
+                for pkg_path, pkg in all_source_packages.items():
+                    if pkg_path in copy_futures:
+                        logging.debug("Package %s is being copied.", pkg_path)
+                    elif not pkg.get("is_synced_to_destination", False):
+                        if pkg.get("stable_checks", 0) > stable_checks:
+                            if retry_copy > pkg.get("copy_retry_count", 0):
+                                # Those packages are not changing size and is not synced yet
+                                # let's copy
+                                ready_packages.append((pkg_path, pkg))
                             else:
-                                pkg["is_synced_to_destination"] = False
-                                pkg["copy_retry_count"] += 1
-                                logging.info(f"Failed copying {pkg['copy_retry_count']} times from {pkg_path} to {destination}")
+                                logging.debug("Package %s exceeded number of copy retry counts %s. Skipping copying...",
+                                              pkg_path, pkg['copy_retry_count'])
                         else:
-                            logging.debug(
-                                f"Package {pkg_path} exceeded number of copy retry counts {pkg['copy_retry_count']}. Skipping copying...")
+                            logging.debug("Package %s copy skipped. %s %s", pkg_path, pkg['stable_checks'], pkg['is_synced_to_destination'])
                     else:
-                        logging.debug(f"Package {pkg_path} copy skipped. {pkg['stable_checks']} {pkg['is_synced_to_destination']}")
-                else:
-                    logging.debug(f"Package {pkg_path} is already synced. Skipping copying...")
+                        logging.debug("Package %s is already synced. Skipping copying...", pkg_path)
+
+                # at most one copy per package is queued, package_workers of them run at once
+                for pkg_path, pkg in ready_packages:
+                    copy_futures[pkg_path] = copy_pool.submit(sync_package, pkg_path, dict(pkg),
+                                                              launch_cmd, copy_workers)
+
+            except Exception as e:
+                logging.error(f"Error during monitoring: {e}", exc_info=True)
+
+            # save, only if anything changed since the last save. The states are kept in memory,
+            # so stable check progress is saved at most every STATE_SAVE_INTERVAL seconds
+            if all_source_packages == saved_states:
+                logging.debug("Folder states unchanged. Skipping save.")
+            elif copy_attempted or time.monotonic() - last_save_time >= STATE_SAVE_INTERVAL:
+                if save_folder_states(source_path, all_source_packages):
+                    saved_states = {path: dict(pkg) for path, pkg in all_source_packages.items()}
+                    last_save_time = time.monotonic()
+            else:
+                logging.debug("Folder states were saved recently. Postponing save.")
+
+            # sleep
+            logging.debug("Sleeping for %s seconds.", check_interval)
+            time.sleep(check_interval)
+
+            # scan the folders again, use current all_source_packages as a starting point
+            changed_packages = change_collector.drain() if change_collector is not None else None
+            if time.monotonic() - last_full_scan_time >= FULL_SCAN_INTERVAL:
+                # don't rely on events alone, check every package now and then
+                changed_packages = None
+            previous_destination_projects = destination_projects
+            destination_projects = find_all_destination_projects(destination_bases)
+            pending_packages = any(not pkg["is_synced_to_destination"] and pkg["copy_retry_count"] < retry_copy
+                                   for pkg in all_source_packages.values())
+            if (changed_packages is not None and not changed_packages and not pending_packages
+                    and destination_projects == previous_destination_projects):
+                # watched source without events, nothing waiting to be synced and the same destinations
+                logging.debug("No changes in %s. Skipping scan.", source_path)
+                continue
+            if changed_packages is None:
+                last_full_scan_time = time.monotonic()
+            all_source_packages = find_all_source_packages(source_path,
+                                                           ingest_prefix,
+                                                           stable_checks,
+                                                           retry_copy,
+                                                           destination_projects,
+                                                           all_source_packages,
+                                                           changed_packages)
+    finally:
+        # flush postponed changes when monitoring stops, e.g. on Ctrl+C or SIGTERM, before
+        # waiting for running copies, which may outlast the stop timeout of a service manager
+        if all_source_packages != saved_states and save_folder_states(source_path, all_source_packages):
+            saved_states = {path: dict(pkg) for path, pkg in all_source_packages.items()}
+        # let running copies finish and record them, drop the ones not started yet
+        copy_pool.shutdown(wait=True, cancel_futures=True)
+        _reap_copies()
+        if all_source_packages != saved_states:
+            save_folder_states(source_path, all_source_packages)
+
+def get_top_level_folders(base):
+    """
+    Lists the top-level folders of a destination base directory.
 
-        except Exception as e:
-            logging.error(f"Error during monitoring: {e}", exc_info=True)
+    The listing is done with a single os.scandir call and cached together with
+    the modification time of the base. As long as the base mtime is unchanged, no
+    folders were added, removed or renamed in it, and the cached listing is
+    returned for the cost of one stat. Symlinks to directories are listed as folders.
 
-        # save
-        save_folder_states(source_path, all_source_packages)
+    Parameters:
+    base: str
+        The directory path to list.
 
-        # sleep
-        logging.debug(f"Sleeping for {check_interval} seconds.")
-        time.sleep(check_interval)
+    Returns:
+    dict
+        A dictionary where the keys are folder names and the values are their
+        corresponding paths.
+
+    Raises:
+    OSError
+        If the base directory doesn't exist or can't be listed.
+    """
+    mtime_ns = os.stat(base).st_mtime_ns
+    cached = _destination_cache.get(base)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
-        # scan the folders again, use current all_source_packages as a starting point
-        destination_projects = find_all_destination_projects(destination_bases)
-        all_source_packages = find_all_source_packages(source_path,
-                                                       ingest_prefix,
-                                                       stable_checks,
-                                                       retry_copy,
-                                                       destination_projects,
-                                                       all_source_packages)
+    with os.scandir(base) as entries:
+        top_level_folders = {entry.name: entry.path for entry in entries if entry.is_dir()}
+    _destination_cache[base] = (mtime_ns, top_level_folders)
+    return top_level_folders
 
 def find_all_destination_projects(destination_bases):
     """
@@ -261,16 +565,15 @@ def find_all_destination_projects(destination_bases):
     
     all_projects = {}
     for base in destination_bases:
-        if os.path.exists(base):
-            top_level_folders = {
-                folder: os.path.join(base, folder)
-                for folder in next(os.walk(base))[1]
-            }
-            all_projects.update(top_level_folders)
+        try:
+            all_projects.update(get_top_level_folders(base))
+        except FileNotFoundError:
+            continue
 
     return all_projects
 
-def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_copy, destination_projects, folder_states):
+def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_copy, destination_projects, folder_states,
+                             changed_packages=None):
     """
     Finds all source packages in a specified directory and organizes metadata for further processing.
 
@@ -291,6 +594,9 @@ def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_co
             Dictionary mapping project names to their corresponding destination paths.
         folder_states: dict
             Dictionary containing cached states of folders for checksum and synchronization validation.
+        changed_packages: set[str] or None
+            Package paths touched by filesystem events since the last scan. Packages not in the set
+            are considered unchanged. None when changes are not watched and every package is checked.
 
     Returns:
         dict
@@ -299,43 +605,42 @@ def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_co
             checksum values, synchronized status, detected date-time, and retry counts.
     """
 
-    ingest_prefix = ingest_prefix.replace("\\", "/")
+    # split the ingest prefix and stamp the detection time once per scan, not per package
+    ingest_parts = ingest_prefix.replace("\\", "/").split("/")
+    package_detected_date_time = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # find all project-user folders at source place
     # skip badly named folders and projects with non-existent destination
     all_packages = {}
 
-    current_folders = {f for f in os.listdir(source_path) if
-                       os.path.isdir(os.path.join(source_path, f))}
-    logging.debug(f"Checking {len(current_folders)} project-user folders at {source_path}...")
-    logging.debug(f"Stable checks {stable_checks},  retry copy {retry_copy}")
+    with os.scandir(source_path) as entries:
+        current_folders = {entry.name: entry.path for entry in entries if entry.is_dir()}
+    logging.debug("Checking %d project-user folders at %s...", len(current_folders), source_path)
+    logging.debug("Stable checks %s,  retry copy %s", stable_checks, retry_copy)
 
-    for one_folder in current_folders:
-        match = re.match(r'^([^-]*)-([^-]*)-In$', one_folder)
+    for one_folder, one_folder_full_path in current_folders.items():
+        match = PROJECT_USER_FOLDER_PATTERN.match(one_folder)
         if match:
             project_name, user_name = match.groups()
-            if project_name not in destination_projects.keys():
+            destination_project = destination_projects.get(project_name)
+            if destination_project is None:
                 # skip project names that do not exist in destination(s)
                 logging.warning(f"Project {project_name} does not exist in destination. Skipping...")
                 continue
 
-            one_folder_full_path = os.path.join(source_path, one_folder)
-            project_user_folders = {f for f in os.listdir(one_folder_full_path) if
-                               os.path.isdir(os.path.join(one_folder_full_path, f))}
-
-            for one_package in project_user_folders:
-                package_path = os.path.join(source_path, one_folder, one_package).replace("\\", "/")
-                destination_project_path = destination_projects[
-                    project_name].replace("\\", "/")
-                destination_package_path = os.path.join(
-                    destination_projects[project_name], *ingest_prefix.split("/"),
-                    user_name, one_package).replace("\\", "/")
-                package_detected_date_time = datetime.now().strftime(
-                    "%Y%m%d_%H%M%S")
-                if folder_states.get(package_path) is not None:
-                    cached_package = folder_states.get(package_path)
+            with os.scandir(one_folder_full_path) as entries:
+                project_user_folders = {entry.name: entry.path for entry in entries if entry.is_dir()}
+
+            destination_project_path = destination_project.replace("\\", "/")
+            destination_user_prefix = os.path.join(destination_project, *ingest_parts, user_name, "").replace("\\", "/")
+
+            for one_package, one_package_full_path in project_user_folders.items():
+                package_path = one_package_full_path.replace("\\", "/")
+                destination_package_path = destination_user_prefix + one_package
+                cached_package = folder_states.get(package_path)
+                if cached_package is not None:
                     # load stable_checks, is_synced_to_destination, checksum from cache
-                    all_packages[package_path] = {
+                    package = {
                         "project_name": project_name,
                         "user_name": user_name,
                         "package_name": one_package,
@@ -344,6 +649,7 @@ def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_co
                         "stable_checks": cached_package.get("stable_checks", 0),
                         "is_synced_to_destination": cached_package.get("is_synced_to_destination", False),
                         "checksum": cached_package.get("checksum", ""),
+                        "watermark": cached_package.get("watermark", ""),
                         "detected_date_time": cached_package.get("detected_date_time", package_detected_date_time),
                         "copied_date_time": cached_package.get("copied_date_time", ""),
                         "copy_retry_count": cached_package.get("copy_retry_count", 0),
@@ -351,7 +657,7 @@ def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_co
                 else:
                     # new package!
                     logging.info(f"New package detected: {one_folder} (Project: {project_name}, User: {user_name})")
-                    all_packages[package_path] = {
+                    package = {
                         "project_name": project_name,
                         "user_name": user_name,
                         "package_name": one_package,
@@ -360,28 +666,52 @@ def find_all_source_packages(source_path, ingest_prefix, stable_checks, retry_co
                         "stable_checks": 0,
                         "is_synced_to_destination": False,
                         "checksum": None,
+                        "watermark": None,
                         "detected_date_time": package_detected_date_time,
                         "copied_date_time": "",
                         "copy_retry_count": 0,
                     }
+                all_packages[package_path] = package
+
                 # only make a checksum if not synced and not provided by cache
-                if not all_packages[package_path]["is_synced_to_destination"]:
-                    if all_packages[package_path]["stable_checks"] <= stable_checks:
-                        if all_packages[package_path]["copy_retry_count"] <= retry_copy:
-
-                            # make a source checksum
-                            current_checksum = get_folder_state(package_path)
-                            if all_packages[package_path]["checksum"] == current_checksum:
-                                all_packages[package_path]["stable_checks"] += 1
-                                logging.debug(f"Package {package_path} checksum matches. Stable checks: {all_packages[package_path]['stable_checks']}.")
+                if not package["is_synced_to_destination"]:
+                    if package["stable_checks"] <= stable_checks:
+                        if package["copy_retry_count"] < retry_copy:
+
+                            # packages without filesystem events since the last scan are unchanged
+                            if (changed_packages is not None
+                                    and package_path not in changed_packages
+                                    and package["checksum"]
+                                    and package["stable_checks"] < stable_checks):
+                                package["stable_checks"] += 1
+                                logging.debug("Package %s has no changes. Stable checks: %s.", package_path, package['stable_checks'])
+                                continue
+
+                            # directory mtimes change whenever files are added, removed or renamed,
+                            # so an unchanged watermark lets us reuse the cached checksum. The final
+                            # check before copying always makes a full checksum to catch in-place writes.
+                            current_watermark = get_folder_watermark(package_path)
+                            if (package["watermark"] == current_watermark
+                                    and package["stable_checks"] < stable_checks):
+                                package["stable_checks"] += 1
+                                logging.debug("Package %s watermark matches. Stable checks: %s.", package_path, package['stable_checks'])
+                                continue
+
+                            # make a source checksum, with exact sizes for the final check before copying
+                            current_checksum = get_folder_state(package_path,
+                                                                exact_sizes=package["stable_checks"] >= stable_checks)
+                            package["watermark"] = current_watermark
+                            if package["checksum"] == current_checksum:
+                                package["stable_checks"] += 1
+                                logging.debug("Package %s checksum matches. Stable checks: %s.", package_path, package['stable_checks'])
                             else:
-                                all_packages[package_path]["stable_checks"] = 0
-                                all_packages[package_path]["checksum"] = current_checksum
-                                logging.debug(f"Package {package_path} checksum not matching. Stable checks: {all_packages[package_path]['stable_checks']}.")
+                                package["stable_checks"] = 0
+                                package["checksum"] = current_checksum
+                                logging.debug("Package %s checksum not matching. Stable checks: %s.", package_path, package['stable_checks'])
                         else:
-                            logging.debug(f"Package {package_path} exceeded number of copy retry counts {all_packages[package_path]['copy_retry_count']}. Skipping checksum calculation...")
+                            logging.debug("Package %s exceeded number of copy retry counts %s. Skipping checksum calculation...", package_path, package['copy_retry_count'])
                     else:
-                        logging.debug(f"Package {package_path} exceeded number of stable checks {all_packages[package_path]['stable_checks']}. Skipping checksum calculation...")
+                        logging.debug("Package %s exceeded number of stable checks %s. Skipping checksum calculation...", package_path, package['stable_checks'])
             else:
                 # name doesn't match the naming convention, skipping
                 pass
@@ -408,53 +738,277 @@ def find_actual_destination(destination_bases, project_name):
         None
     """
     for base in destination_bases:
-        if os.path.exists(base):
-            top_level_folders = set(
-                next(os.walk(base))[1])  # Get top-level folder names
-            if project_name in top_level_folders:
-                return os.path.join(base, project_name)
-            else:
-                logging.debug(
-                    f"No matching project '{project_name}' in destination base: {base}")
-        else:
+        try:
+            top_level_folders = get_top_level_folders(base)
+        except FileNotFoundError:
             logging.warning(f"Destination base path does not exist: {base}")
+            continue
+        if project_name in top_level_folders:
+            return top_level_folders[project_name]
+        else:
+            logging.debug("No matching project '%s' in destination base: %s", project_name, base)
     return None
 
-def get_folder_state(folder_path):
+def _load_statx():
+    """
+    Returns the libc statx function on Linux, or None where it is not available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+_statx = _load_statx()
+
+def _file_size(entry):
+    """
+    Returns the size of the file behind a DirEntry.
+
+    On Linux the size is read with statx and AT_STATX_DONT_SYNC, which lets network
+    filesystems answer from their attribute cache instead of asking the server. The size
+    may be stale, so this is only used for stability checks that are followed by more
+    checks; the final check before copying reads exact sizes. Elsewhere, or if statx fails
+    or doesn't return the size, the DirEntry stat is used. On local disks the ctypes call
+    is slower than DirEntry.stat, so get_folder_state only uses this on network filesystems.
+    """
+    if _statx is not None:
+        buffer = ctypes.create_string_buffer(STATX_BUFFER_SIZE)
+        if _statx(AT_FDCWD, os.fsencode(entry.path), AT_STATX_DONT_SYNC, STATX_SIZE, buffer) == 0:
+            mask = int.from_bytes(buffer.raw[STATX_MASK_OFFSET:STATX_MASK_OFFSET + 4], sys.byteorder)
+            if mask & STATX_SIZE:
+                return int.from_bytes(buffer.raw[STATX_SIZE_OFFSET:STATX_SIZE_OFFSET + 8], sys.byteorder)
+    return entry.stat().st_size
+
+def _is_network_filesystem(path):
+    """
+    Tells whether a path is on a network filesystem, from the filesystem type of its device
+    in /proc/self/mountinfo. The answer is cached per device. Without statx, or if the type
+    can't be found, the path is taken to be local.
+    """
+    if _statx is None:
+        return False
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return False
+    is_network = _network_devices.get(device)
+    if is_network is None:
+        is_network = False
+        device_id = f"{os.major(device)}:{os.minor(device)}"
+        try:
+            with open("/proc/self/mountinfo") as mountinfo:
+                for line in mountinfo:
+                    fields = line.split()
+                    if fields[2] == device_id:
+                        # the filesystem type follows the "-" separator of the optional fields
+                        is_network = fields[fields.index("-") + 1] in NETWORK_FILESYSTEM_TYPES
+                        break
+        except (OSError, ValueError, IndexError):
+            pass
+        _network_devices[device] = is_network
+    return is_network
+
+def get_folder_state(folder_path, exact_sizes=False):
     """
     Computes a unique hash representing the state of all files within a specified folder.
 
-    This function recursively traverses a folder and builds a set of all file paths relative
-    to the folder root along with their corresponding file sizes. The state of the folder is
-    then condensed into a unique hash representing its current state.
+    This function collects all file paths relative to the folder root along with their
+    corresponding file sizes with get_folder_files, so every file costs a single stat call.
+    On network filesystems the sizes are read with _file_size, which may answer from the
+    attribute cache, unless exact sizes are asked for. The state of the folder is then
+    condensed into a fingerprint representing its current state.
 
     Args:
         folder_path (str): The path to the folder whose state needs to be computed.
+        exact_sizes (bool, optional): Never read sizes from the attribute cache, e.g. for the
+            last check before copying. Default is False.
 
     Returns:
-        int: A unique hash representing the state of the folder.
+        str: A hex digest representing the state of the folder.
 
     Raises:
         None
     """
+    cached_sizes = not exact_sizes and _is_network_filesystem(folder_path)
+    return get_state_checksum(get_folder_files(folder_path, cached_sizes=cached_sizes))
+
+def _walk_folder(folder_path):
+    """
+    Walks a folder with os.scandir, using an explicit stack of directories instead of recursion.
+
+    Symlinks are handled like os.walk with os.path.getsize does: symlinked files are listed and
+    sized by their target, symlinked folders are not descended into and broken links are skipped.
+    Folders that don't exist or can't be read are skipped as well.
+
+    Yields:
+        tuple[str, list[os.DirEntry]]: The path of every folder relative to folder_path, empty
+            for folder_path itself and ending with os.sep otherwise, and the files directly in it.
+    """
+    pending = [("", folder_path)]
+    while pending:
+        relative_dir, directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        file_entries = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((relative_dir + entry.name + os.sep, entry.path))
+                elif entry.is_file():
+                    file_entries.append(entry)
+        yield relative_dir, file_entries
+
+def get_folder_files(folder_path, cached_sizes=False):
+    """
+    Lists all files within a specified folder with their sizes.
+
+    This function traverses a folder with _walk_folder. Folders that don't exist or can't be
+    read have no files.
+
+    Args:
+        folder_path (str): The path to the folder whose files need to be listed.
+        cached_sizes (bool, optional): Read sizes with _file_size, which may answer from the
+            attribute cache of network filesystems. Otherwise the exact DirEntry stat is used.
+            Default is False.
+
+    Returns:
+        set[tuple[str, int]]: Paths relative to the folder root with their file sizes.
+    """
+    files = set()
+    for relative_dir, file_entries in _walk_folder(folder_path):
+        for entry in file_entries:
+            if cached_sizes:
+                files.add((relative_dir + entry.name, _file_size(entry)))
+            else:
+                files.add((relative_dir + entry.name, entry.stat().st_size))
+
+    return files
+
+def get_folder_watermark(folder_path):
+    """
+    Computes a cheap fingerprint of the directory structure within a specified folder.
+
+    Only directories are stat'ed: the modification time of every directory, including
+    the folder itself, is collected with its relative path and condensed with
+    get_state_checksum. A directory mtime changes whenever an entry is added, removed or
+    renamed in it, which covers the temp-file-and-rename writes of the NextCloud client,
+    but not files growing in place. The directories are walked with an explicit stack, and
+    like os.walk, directories that are removed or can't be read while scanning are skipped.
+
+    Args:
+        folder_path (str): The path to the folder whose watermark needs to be computed.
+
+    Returns:
+        str: A hex digest representing the directory mtimes of the folder.
+    """
     state = set()
-    for dirpath, _, filenames in os.walk(folder_path):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            relative_path = os.path.relpath(filepath, folder_path)
-            size = os.path.getsize(filepath)
-            state.add((relative_path, size))
-    state_hash = hash(frozenset(state))
-    return state_hash
+    try:
+        pending = [("", folder_path, os.stat(folder_path).st_mtime_ns)]
+    except OSError:
+        # the package itself is gone or unreadable, it has no directories to fingerprint
+        pending = []
+    while pending:
+        relative_dir, directory, mtime_ns = pending.pop()
+        state.add((relative_dir, mtime_ns))
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    try:
+                        subfolder_mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                    pending.append((relative_dir + entry.name + os.sep, entry.path, subfolder_mtime_ns))
+
+    return get_state_checksum(state)
+
+def get_state_checksum(state):
+    """
+    Condenses a set of (relative path, size) tuples into a unique fingerprint.
+
+    Entries are fed in sorted order into a 16 byte BLAKE2b digest, so the result is
+    stable across runs and can be cached in the folder states file and compared as a
+    plain string.
+
+    Args:
+        state (Iterable[tuple[str, int]]): Relative file paths and sizes of a folder.
+
+    Returns:
+        str: A hex digest representing the given folder state.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path, size in sorted(state):
+        digest.update(relative_path.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+        digest.update(size.to_bytes(8, "little"))
+    return digest.hexdigest()
+
+def _ensure_dir(path):
+    """
+    Creates a directory with its parents, unless this process already made sure it exists.
+    """
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _advise(fd, advice):
+    """
+    Gives the kernel an os.posix_fadvise hint for a whole file, where supported.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
 
-def copy_folder(source, destination, destination_state):
+def _fast_copy(source_file, dest_file):
+    """
+    Copy a file together with its metadata, like shutil.copy2.
+
+    Where available (Linux), the data is moved with os.copy_file_range, which keeps the
+    bytes in the kernel and lets the filesystem do reflinks or server-side copies. The
+    source is read sequentially and dropped from the page cache afterwards, since synced
+    packages are not read again. If the filesystems don't support copy_file_range, this
+    falls back to shutil.copy2.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_file, "rb") as src, open(dest_file, "wb") as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                _advise(src_fd, "POSIX_FADV_SEQUENTIAL")
+                while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE):
+                    pass
+                _advise(src_fd, "POSIX_FADV_DONTNEED")
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            logging.debug("copy_file_range not supported for %s: %s", source_file, exc)
+        else:
+            shutil.copystat(source_file, dest_file)
+            return dest_file
+    return shutil.copy2(source_file, dest_file)
+
+def copy_folder(source, destination, destination_state, max_workers=None):
     """
     Copies a folder and its contents to a destination folder, skipping files that
     already exist in the destination with the same relative path and size.
 
-    This function traverses the source folder, reproduces its structure in the
-    destination, and efficiently copies files that are absent or modified relative
-    to the destination state. Metadata such as timestamps are preserved during the
+    This function traverses the source folder with _walk_folder, reproduces its
+    structure in the destination, and efficiently copies files that are absent or
+    modified relative to the destination state. File sizes come from the DirEntry
+    stat gathered during traversal. The files are handed to a bounded pool of
+    threads as soon as they are found, so the walk and the reads and writes of
+    several files overlap. Metadata such as timestamps are preserved during the
     copy process.
 
     Parameters:
@@ -465,33 +1019,61 @@ def copy_folder(source, destination, destination_state):
     destination_state: set[tuple[str, int]]
         A set containing tuples of the relative paths and sizes of files already
         present in the destination folder.
+    max_workers: int, optional
+        Number of files copied concurrently. Defaults to COPY_WORKERS.
 
     Returns:
-    bool
-        Returns True if at least one file was copied, otherwise returns False.
-    """
-    copied = False
-    for dirpath, _, filenames in os.walk(source):
-        relative_dir = os.path.relpath(dirpath, source)
-        dest_subdir = os.path.join(destination, relative_dir)
-
-        # Create directories in the destination as needed
-        os.makedirs(dest_subdir, exist_ok=True)
+    tuple[set[tuple[str, int]], set[tuple[str, int]]]
+        The relative paths and sizes of all source files as seen by this walk,
+        so the caller can tell whether the source changed since it was
+        checksummed, and the relative paths and sizes of all source files now
+        present in the destination. Sizes of copied files are read back from
+        the destination, so the result can be checked against the source
+        checksum without walking the destination tree again. Both are empty if
+        nothing was found to copy.
 
-        for filename in filenames:
-            source_file = os.path.join(dirpath, filename)
-            dest_file = os.path.join(dest_subdir, filename)
-
-            # Get file size and relative path
-            relative_path = os.path.relpath(source_file, source)
-            size = os.path.getsize(source_file)
+    Raises:
+    OSError
+        If any of the files fails to copy.
+    """
+    source_state = set()
+    synced_state = set()
+    futures = []
+
+    def _collect():
+        for relative_dir, file_entries in _walk_folder(source):
+            # Create directories in the destination as needed, once per directory
+            dest_prefix = os.path.join(destination, relative_dir)
+            _ensure_dir(dest_prefix)
+
+            for entry in file_entries:
+                # Get file size from the cached DirEntry and build the relative path
+                relative_path = relative_dir + entry.name
+                size = entry.stat().st_size
+                source_state.add((relative_path, size))
+
+                # Check if the file needs to be copied
+                if (relative_path, size) not in destination_state:
+                    futures.append(executor.submit(_copy, entry.path, dest_prefix + entry.name, relative_path))
+                else:
+                    synced_state.add((relative_path, size))
 
-            # Check if the file needs to be copied
-            if (relative_path, size) not in destination_state:
-                shutil.copy2(source_file, dest_file)  # Efficient file copy with metadata
-                logging.debug(f"Copied file: {source_file} -> {dest_file}")
-                copied = True
-    return copied
+    def _copy(source_file, dest_file, relative_path):
+        try:
+            _fast_copy(source_file, dest_file)  # Efficient file copy with metadata
+        except FileNotFoundError:
+            # destination directories may have been removed behind our back, recreate them next time
+            _ensured_dirs.clear()
+            raise
+        logging.debug("Copied file: %s -> %s", source_file, dest_file)
+        return relative_path, os.stat(dest_file).st_size
+
+    # files are submitted while the source is still being walked, so copying starts right away
+    with ThreadPoolExecutor(max_workers=max_workers or COPY_WORKERS) as executor:
+        _collect()
+        for future in as_completed(futures):
+            synced_state.add(future.result())
+    return source_state, synced_state
 
 if __name__ == "__main__":
     # Parse command-line arguments
@@ -519,8 +1101,17 @@ if __name__ == "__main__":
         ),
         default=None
     )
+    parser.add_argument("--copy_workers", type=int, default=COPY_WORKERS,
+                        help=f"Number of files copied concurrently. Default is {COPY_WORKERS}.")
+    parser.add_argument("--package_workers", type=int, default=PACKAGE_WORKERS,
+                        help="Number of packages copied concurrently. Post-sync commands of "
+                             "packages copied at the same time may run concurrently, use 1 to "
+                             f"sync and run them one at a time. Default is {PACKAGE_WORKERS}.")
     args = parser.parse_args()
 
+    # Stop on SIGTERM like on Ctrl+C, so postponed folder states are saved
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     # Configure logging
     log_level = logging.DEBUG if args.log_level.upper() == "DEBUG" else logging.INFO
     configure_logging(log_level=log_level, log_directory=f"{args.source_directory}/_synclogs")
@@ -530,7 +1121,9 @@ if __name__ == "__main__":
             source_path=args.source_directory,
             destination_bases=args.destination_directories,
             check_interval=args.check_interval,
-            launch_cmd=args.launchcmd
+            launch_cmd=args.launchcmd,
+            copy_workers=args.copy_workers,
+            package_workers=args.package_workers
         )
     except Exception as e:
         logging.error(f"Failed to start monitoring: {e}")